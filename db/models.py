@@ -1,37 +1,19 @@
 from datetime import datetime
 from typing import Optional
 
+from pgvector import HalfVector
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     func,
-    TypeDecorator,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy.types import ARRAY, Float
-
-
-class Vector(TypeDecorator):
-    """Custom type for pgvector.
-
-    pgvector stores vectors as arrays of floats.
-    """
-    impl = ARRAY(Float)
-    cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        return list(value)
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return None
-        return list(value)
 
 
 class Base(DeclarativeBase):
@@ -42,9 +24,10 @@ class Base(DeclarativeBase):
 class Event(Base):
     """Local replica of calendar events."""
     __tablename__ = "events"
+    __table_args__ = (Index("ix_events_user_id_start", "user_id", "start"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    user_id: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     start: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
@@ -78,7 +61,8 @@ class Embedding(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     document_id: Mapped[int] = mapped_column(ForeignKey("documents.id", ondelete="CASCADE"), index=True, nullable=False)
-    embedding: Mapped[list[float]] = mapped_column(Vector(384), nullable=False)  # vector column
+    # Half-precision vector column; pgvector loads it as a HalfVector, not a list.
+    embedding: Mapped[HalfVector] = mapped_column(HALFVEC(384), nullable=False)
     model_version: Mapped[str] = mapped_column(String, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
 
@@ -1,39 +1,35 @@
 from __future__ import annotations
 
 import logging
-import os
+from functools import lru_cache
 
-from pydantic import BaseModel, ConfigDict
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class Settings(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(extra="ignore", frozen=True, env_file=".env")
 
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
-    openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    openai_temperature: float = float(os.getenv("OPENAI_TEMPERATURE", 0.2))
-    openai_api_host: str = os.getenv(
-        "OPENAI_API_HOST", "https://api.openai.com/v1"
-    )
+    openai_api_key: str = ""
+    openai_model: str = "gpt-4o-mini"
+    openai_temperature: float = 0.2
+    openai_api_host: str = "https://api.openai.com/v1"
 
-    llm_provider: str = os.getenv("LLM_PROVIDER", "openai")
-    openrouter_api_key: str = os.getenv("OPENROUTER_API_KEY", "")
-    openrouter_api_host: str = os.getenv(
-        "OPENROUTER_API_HOST", "https://openrouter.ai/api/v1"
-    )
+    llm_provider: str = "openai"
+    openrouter_api_key: str = ""
+    openrouter_api_host: str = "https://openrouter.ai/api/v1"
 
-    project_timezone: str = os.getenv("PROJECT_TIMEZONE", "Europe/Riga")
+    project_timezone: str = "Europe/Riga"
 
-    google_creds_json: str = os.getenv("GOOGLE_CREDS_JSON", "")
-    google_token_json: str = os.getenv("GOOGLE_TOKEN_JSON", "")
-    google_calendar_id: str = os.getenv("GOOGLE_CALENDAR_ID", "primary")
+    google_creds_json: str = ""
+    google_token_json: str = ""
+    google_calendar_id: str = "primary"
 
-    google_client_id: str = os.getenv("GOOGLE_CLIENT_ID", "")
-    google_client_secret: str = os.getenv("GOOGLE_CLIENT_SECRET", "")
-    google_redirect_uri: str = os.getenv("GOOGLE_REDIRECT_URI", "")
+    google_client_id: str = ""
+    google_client_secret: str = ""
+    google_redirect_uri: str = ""
 
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    sqlite_db_path: str = os.getenv("SQLITE_DB_PATH", "calendar_assistant.db")
+    log_level: str = "INFO"
+    sqlite_db_path: str = "calendar_assistant.db"
 
     def model_post_init(self, __context: dict[str, object]) -> None:
         logger = logging.getLogger(__name__)
@@ -50,4 +46,8 @@ class Settings(BaseModel):
             )
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings snapshot (environment is read once)."""
+
+    return Settings()
@@ -1,9 +1,26 @@
+from functools import lru_cache
+
+from fastapi import Depends
+
+from app.config import get_settings
+from app.services.calendar_client import ICalendarClient
+from app.services.google_calendar import GoogleCalendarClient
+from app.services.llm_client import LLMClient
 from app.sgr import SGRController
 
-_controller: SGRController | None = None
 
-def get_controller() -> SGRController:
-    global _controller
-    if _controller is None:
-        _controller = SGRController()
-    return _controller
+@lru_cache(maxsize=1)
+def get_llm_client() -> LLMClient:
+    return LLMClient(settings=get_settings())
+
+
+@lru_cache(maxsize=1)
+def get_calendar_client() -> GoogleCalendarClient:
+    return GoogleCalendarClient(settings=get_settings())
+
+
+def get_controller(
+    llm: LLMClient = Depends(get_llm_client),
+    calendar: ICalendarClient = Depends(get_calendar_client),
+) -> SGRController:
+    return SGRController(llm=llm, calendar=calendar)
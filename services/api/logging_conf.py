@@ -8,4 +8,12 @@ def setup_logging(level: str = "INFO") -> None:
     root = logging.getLogger()
     root.setLevel(level)
     root.handlers.clear()
-    root.addHandler(handler)
\ No newline at end of file
+    root.addHandler(handler)
+
+    # The format above never uses caller/thread/process fields; skip collecting
+    # them for every record (see "Optimization" in the logging HOWTO).
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
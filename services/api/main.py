@@ -1,8 +1,8 @@
 from __future__ import annotations
 import logging
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Response
 from app.logging_conf import setup_logging
-from app.config import settings
+from app.config import get_settings
 from app.models import (
     SuggestEventsRequest,
     SuggestEventsResponse,
@@ -11,7 +11,7 @@ from app.models import (
 )
 from app.deps import get_controller
 
-setup_logging(settings.log_level)
+setup_logging(get_settings().log_level)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="AI Calendar Assistant", version="0.1.0")
@@ -21,12 +21,17 @@ def health() -> dict:
     return {"status": "ok"}
 
 @app.post("/events/suggest", response_model=SuggestEventsResponse)
-def events_suggest(req: SuggestEventsRequest, ctrl = Depends(get_controller)):
-    return ctrl.suggest(req)
+async def events_suggest(req: SuggestEventsRequest, ctrl = Depends(get_controller)):
+    resp = await ctrl.asuggest(req)
+    # Serialise in pydantic-core directly instead of FastAPI's jsonable_encoder pass.
+    return Response(
+        content=resp.model_dump_json(exclude_none=True),
+        media_type="application/json",
+    )
 
 @app.post("/events/sync", response_model=CommitResult)
-def events_sync(plan: CommitPlan, ctrl = Depends(get_controller)):
-    return ctrl.commit(plan)
+async def events_sync(plan: CommitPlan, ctrl = Depends(get_controller)):
+    return await ctrl.acommit(plan)
 
 # Заготовки для OAuth/вебхуков — реализация зависит от выбранного потока авторизации
 @app.get("/auth/google/init")
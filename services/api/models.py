@@ -12,17 +12,27 @@ class StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
-class Attendee(StrictModel):
+class FrozenModel(StrictModel):
+    """Immutable strict model for values created on every suggestion/commit."""
+
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
+
+class Attendee(FrozenModel):
     email: str
     optional: bool = False
 
 
-class Reminder(StrictModel):
+class Reminder(FrozenModel):
     method: Literal["popup", "email"] = "popup"
     minutes_before: int = Field(default=15, ge=0)
 
 
-class Recurrence(StrictModel):
+# Reminder is frozen, so one shared default instance is safe to reuse.
+DEFAULT_REMINDERS: tuple[Reminder, ...] = (Reminder(),)
+
+
+class Recurrence(FrozenModel):
     rrule: Optional[str] = None  # e.g., "RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR"
 
 
@@ -39,7 +49,7 @@ class EventDraft(StrictModel):
     source: Optional[str] = None
 
 
-class CalendarEvent(StrictModel):
+class CalendarEvent(FrozenModel):
     title: str
     description: Optional[str] = None
     start: datetime
@@ -47,7 +57,7 @@ class CalendarEvent(StrictModel):
     timezone: str = "Europe/Riga"
     location: Optional[str] = None
     attendees: list[Attendee] = Field(default_factory=list)
-    reminders: list[Reminder] = Field(default_factory=lambda: [Reminder()])
+    reminders: list[Reminder] = Field(default_factory=lambda: list(DEFAULT_REMINDERS))
     recurrence: Optional[Recurrence] = None
     source: Optional[str] = None  # free text (why this event exists)
 
@@ -82,7 +92,7 @@ class CommitDecision(StrictModel):
     reason: Optional[str] = None
 
 
-class CommitPlanItem(StrictModel):
+class CommitPlanItem(FrozenModel):
     event: CalendarEvent
     decision: CommitDecision
 
@@ -91,6 +101,29 @@ class CommitPlan(StrictModel):
     items: list[CommitPlanItem]
     trace_id: str
 
+    @classmethod
+    def from_suggestions(
+        cls,
+        response: SuggestEventsResponse,
+        kind: Literal["create", "update", "skip"] = "create",
+    ) -> CommitPlan:
+        """Build a plan from controller output without re-validating it.
+
+        Only for trusted, in-process flows: ``response.candidates`` have
+        already been validated by the repair step.
+        """
+
+        return cls.model_construct(
+            items=[
+                CommitPlanItem.model_construct(
+                    event=event,
+                    decision=CommitDecision.model_construct(kind=kind, reason=None),
+                )
+                for event in response.candidates
+            ],
+            trace_id=response.trace_id,
+        )
+
 
 class CommitResult(StrictModel):
     created: int
@@ -4,9 +4,17 @@ SYSTEM = (
     "Provide precise ISO 8601 datetimes with timezone offsets and include context in the description when helpful."
 )
 
-USER_TEMPLATE = (
-    "Instruction:\n{instruction}\n\n"
-    "Current moment = {now}\n"
-    "User timezone = {timezone}\n\n"
-    "Return ONLY valid JSON with the `candidates` array. Each event must have `title`, `start`, `end`, `timezone` and, when known, `description`, `location`, `attendees` and `reminders`."
-)
\ No newline at end of file
+USER_TEMPLATE_PARTS = (
+    "Instruction:\n",
+    "\n\nCurrent moment = ",
+    "\nUser timezone = ",
+    "\n\n"
+    "Return ONLY valid JSON with the `candidates` array. Each event must have `title`, `start`, `end`, `timezone` and, when known, `description`, `location`, `attendees` and `reminders`.",
+)
+
+
+def render_user(instruction: str, now: str, timezone: str) -> str:
+    """Build the user prompt without going through ``str.format`` parsing."""
+
+    p0, p1, p2, p3 = USER_TEMPLATE_PARTS
+    return f"{p0}{instruction}{p1}{now}{p2}{timezone}{p3}"
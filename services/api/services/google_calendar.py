@@ -1,45 +1,59 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import math
+import time
+from datetime import timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Sequence
 from uuid import uuid4
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import orjson
 
-from app.config import settings
-from app.models import CalendarEvent, Reminder
+from app.config import Settings, get_settings
+from app.models import CalendarEvent
 from app.services.sqlite_store import CalendarSQLiteStore
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from google.oauth2.credentials import Credentials
+
 logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 TOKEN_PROVIDER = "google_calendar"
+API_NUM_RETRIES = 3  # idempotent calls only; a retried insert could duplicate events
+BATCH_LIMIT = 50  # Calendar API maximum number of calls per batch request
+CREDS_EXPIRY_MARGIN = 60.0  # seconds before expiry at which cached creds are reloaded
+
+# (store path, provider) -> (expiry timestamp, credentials)
+_CREDS_CACHE: dict[tuple[str, str], tuple[float, Credentials]] = {}
 
 
 def _read_possible_json(source: str) -> str | None:
     if not source:
         return None
-    path = Path(source)
-    if path.exists():
-        return path.read_text(encoding="utf-8")
+    # Inline JSON is detected before touching the filesystem: it saves a stat()
+    # and long blobs would otherwise fail with ENAMETOOLONG. ``strip`` returns
+    # ``source`` itself when there is nothing to trim.
     candidate = source.strip()
     if candidate.startswith("{") and candidate.endswith("}"):
         return candidate
+    path = Path(source)
+    if path.exists():
+        return path.read_text(encoding="utf-8")
     return None
 
 
 class GoogleOAuthManager:
     """Handles OAuth credential lifecycle for Google Calendar."""
 
-    def __init__(self, store: CalendarSQLiteStore) -> None:
+    def __init__(
+        self, store: CalendarSQLiteStore, *, settings: Settings | None = None
+    ) -> None:
         self._store = store
+        self._settings = settings or get_settings()
 
     def ensure_credentials(self, *, interactive: bool = False) -> Credentials | None:
         creds = self._load_credentials()
@@ -50,15 +64,22 @@ class GoogleOAuthManager:
         return None
 
     def _load_credentials(self) -> Credentials | None:
+        entry = _CREDS_CACHE.get(self._cache_key)
+        if entry and entry[0] > time.time() + CREDS_EXPIRY_MARGIN:
+            return entry[1]
+
         token_data = self._store.load_token(TOKEN_PROVIDER)
-        if not token_data and settings.google_token_json:
-            token_data = _read_possible_json(settings.google_token_json)
+        if not token_data and self._settings.google_token_json:
+            token_data = _read_possible_json(self._settings.google_token_json)
             if token_data:
                 self._store.save_token(TOKEN_PROVIDER, token_data)
         if not token_data:
             return None
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+
         try:
-            info = json.loads(token_data)
+            info = orjson.loads(token_data)
             creds = Credentials.from_authorized_user_info(info, SCOPES)
         except Exception as exc:  # pragma: no cover - corrupted credentials
             logger.error("Failed to load Google credentials: %s", exc)
@@ -70,26 +91,43 @@ class GoogleOAuthManager:
                 self._store.save_token(TOKEN_PROVIDER, creds.to_json())
             except Exception as exc:  # pragma: no cover - network refresh failure
                 logger.warning("Failed to refresh Google token: %s", exc)
-        return creds if creds and creds.valid else None
+        if not (creds and creds.valid):
+            return None
+        self._remember(creds)
+        return creds
 
     def _run_interactive_flow(self) -> Credentials | None:
         client_config = self._load_client_config()
         if not client_config:
             logger.warning("Google OAuth config not provided; cannot run flow")
             return None
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
         creds = flow.run_local_server(port=0)
         self._store.save_token(TOKEN_PROVIDER, creds.to_json())
+        self._remember(creds)
         return creds
 
-    @staticmethod
-    def _load_client_config() -> dict[str, Any] | None:
+    @property
+    def _cache_key(self) -> tuple[str, str]:
+        return str(self._store.path), TOKEN_PROVIDER
+
+    def _remember(self, creds: Credentials) -> None:
+        expiry = creds.expiry  # naive UTC, None when the token never expires
+        expires_at = (
+            expiry.replace(tzinfo=timezone.utc).timestamp() if expiry else math.inf
+        )
+        _CREDS_CACHE[self._cache_key] = (expires_at, creds)
+
+    def _load_client_config(self) -> dict[str, Any] | None:
+        settings = self._settings
         if settings.google_creds_json:
             raw = _read_possible_json(settings.google_creds_json)
             if raw:
                 try:
-                    return json.loads(raw)
-                except json.JSONDecodeError:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
                     logger.warning("Invalid GOOGLE_CREDS_JSON payload provided")
         if settings.google_client_id and settings.google_client_secret:
             redirect_uri = settings.google_redirect_uri or "http://localhost"
@@ -113,10 +151,12 @@ class GoogleCalendarClient:
         *,
         store: CalendarSQLiteStore | None = None,
         auth_manager: GoogleOAuthManager | None = None,
+        settings: Settings | None = None,
     ) -> None:
+        settings = settings or get_settings()
         self.calendar_id = settings.google_calendar_id
         self._store = store or CalendarSQLiteStore(settings.sqlite_db_path)
-        self._auth = auth_manager or GoogleOAuthManager(self._store)
+        self._auth = auth_manager or GoogleOAuthManager(self._store, settings=settings)
         self._service = None
         self._dry_run = True
 
@@ -132,8 +172,17 @@ class GoogleCalendarClient:
     # ----------------------------------------------------------------- helpers
     def _initialise_service(self, creds: Credentials) -> None:
         try:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.discovery import build
+            from googleapiclient.http import build_http
+
             self._service = build(
-                "calendar", "v3", credentials=creds, cache_discovery=False
+                "calendar",
+                "v3",
+                http=AuthorizedHttp(creds, http=build_http()),
+                cache_discovery=False,
+                static_discovery=True,
+                model=_orjson_model(),
             )
             self._dry_run = False
         except Exception as exc:  # pragma: no cover - API discovery errors
@@ -156,10 +205,12 @@ class GoogleCalendarClient:
 
     # ---------------------------------------------------------------- operations
     def create_event(self, ev: CalendarEvent) -> str:
-        payload = self._to_google_payload(ev)
         event_id: str | None = None
 
         if not self.dry_run:
+            from googleapiclient.errors import HttpError
+
+            payload = self._to_google_payload(ev)
             try:
                 created = (
                     self._service.events()
@@ -178,13 +229,44 @@ class GoogleCalendarClient:
         self._store.save_calendar_event(event_id, ev)
         return event_id
 
+    def bulk_create(self, events: Sequence[CalendarEvent]) -> list[str]:
+        """Insert ``events`` using batch requests; returns ids in input order."""
+
+        if self.dry_run:
+            with self._store.transaction():
+                return [self.create_event(ev) for ev in events]
+
+        created = self._execute_batch(
+            [
+                self._service.events().insert(
+                    calendarId=self.calendar_id, body=self._to_google_payload(ev)
+                )
+                for ev in events
+            ],
+            "bulk_create",
+        )
+
+        result: list[str] = []
+        with self._store.transaction():
+            for response in created:
+                event_id = response.get("id") if response else None
+                if event_id:
+                    self._store.save_payload(event_id, response)
+                else:
+                    event_id = f"dry-run-{uuid4().hex}"
+                result.append(event_id)
+            self._store.save_calendar_events(list(zip(result, events, strict=True)))
+        return result
+
     def update_event(self, ev_id: str, ev: CalendarEvent) -> str:
-        payload = self._to_google_payload(ev)
         if not self.dry_run:
+            from googleapiclient.errors import HttpError
+
+            payload = self._to_google_payload(ev)
             try:
                 self._service.events().update(
                     calendarId=self.calendar_id, eventId=ev_id, body=payload
-                ).execute()
+                ).execute(num_retries=API_NUM_RETRIES)
                 self._store.save_payload(ev_id, payload)
             except HttpError as exc:
                 logger.error("Google API update_event error: %s", exc)
@@ -193,8 +275,35 @@ class GoogleCalendarClient:
         self._store.save_calendar_event(ev_id, ev)
         return ev_id
 
+    def bulk_update(self, items: Sequence[tuple[str, CalendarEvent]]) -> list[str]:
+        """Update ``(event_id, event)`` pairs using batch requests; returns the ids."""
+
+        if self.dry_run:
+            with self._store.transaction():
+                return [self.update_event(ev_id, ev) for ev_id, ev in items]
+
+        payloads = [self._to_google_payload(ev) for _, ev in items]
+        updated = self._execute_batch(
+            [
+                self._service.events().update(
+                    calendarId=self.calendar_id, eventId=ev_id, body=payload
+                )
+                for (ev_id, _), payload in zip(items, payloads, strict=True)
+            ],
+            "bulk_update",
+        )
+
+        with self._store.transaction():
+            for (ev_id, _), payload, response in zip(items, payloads, updated, strict=True):
+                if response is not None:
+                    self._store.save_payload(ev_id, payload)
+            self._store.save_calendar_events(items)
+        return [ev_id for ev_id, _ in items]
+
     def list_between(self, time_min_iso: str, time_max_iso: str) -> list[dict]:
         if not self.dry_run:
+            from googleapiclient.errors import HttpError
+
             try:
                 response = (
                     self._service.events()
@@ -205,11 +314,12 @@ class GoogleCalendarClient:
                         singleEvents=True,
                         orderBy="startTime",
                     )
-                    .execute()
+                    .execute(num_retries=API_NUM_RETRIES)
                 )
                 items = response.get("items", [])
-                for item in items:
-                    self._store.save_payload(item.get("id"), item)
+                with self._store.transaction():
+                    for item in items:
+                        self._store.save_payload(item.get("id"), item)
                 return items
             except HttpError as exc:
                 logger.error("Google API list_between error: %s", exc)
@@ -218,6 +328,35 @@ class GoogleCalendarClient:
         return self._store.list_between(time_min_iso, time_max_iso)
 
     # ----------------------------------------------------------------- internal
+    def _execute_batch(
+        self, requests: Sequence[Any], operation: str
+    ) -> list[dict[str, Any] | None]:
+        """Run ``requests`` in batch calls of ``BATCH_LIMIT``; failed entries yield ``None``."""
+
+        from googleapiclient.errors import HttpError
+
+        responses: list[dict[str, Any] | None] = [None] * len(requests)
+
+        def _on_response(
+            request_id: str, response: dict[str, Any], exception: Exception | None
+        ) -> None:
+            if exception is not None:
+                logger.error("Google API %s error: %s", operation, exception)
+                return
+            responses[int(request_id)] = response
+
+        for offset in range(0, len(requests), BATCH_LIMIT):
+            batch = self._service.new_batch_http_request(callback=_on_response)
+            for index in range(offset, min(offset + BATCH_LIMIT, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+            try:
+                batch.execute()
+            except HttpError as exc:
+                logger.error("Google API %s error: %s", operation, exc)
+            except Exception:  # pragma: no cover - defensive logging
+                logger.exception("Unexpected Google API error during %s", operation)
+        return responses
+
     @staticmethod
     def _to_google_payload(ev: CalendarEvent) -> dict[str, Any]:
         body: dict[str, Any] = {
@@ -231,16 +370,7 @@ class GoogleCalendarClient:
                 "dateTime": ev.end.isoformat(),
                 "timeZone": ev.timezone,
             },
-            "reminders": {
-                "useDefault": False,
-                "overrides": [
-                    {
-                        "method": reminder.method,
-                        "minutes": reminder.minutes_before,
-                    }
-                    for reminder in GoogleCalendarClient._unique_reminders(ev.reminders)
-                ],
-            },
+            "reminders": GoogleCalendarClient._reminders_block(ev),
         }
         if ev.location:
             body["location"] = ev.location
@@ -257,16 +387,33 @@ class GoogleCalendarClient:
         return body
 
     @staticmethod
-    def _unique_reminders(reminders: list[Reminder]) -> list[Reminder]:
-        seen: set[tuple[str, int]] = set()
-        result: list[Reminder] = []
-        for reminder in reminders:
-            key = (reminder.method, reminder.minutes_before)
-            if key in seen:
-                continue
-            seen.add(key)
-            result.append(reminder)
-        return result
+    def _reminders_block(ev: CalendarEvent) -> dict[str, Any]:
+        keys = tuple(
+            dict.fromkeys((reminder.method, reminder.minutes_before) for reminder in ev.reminders)
+        )
+        return {
+            "useDefault": False,
+            "overrides": [{"method": method, "minutes": minutes} for method, minutes in keys],
+        }
+
+
+@lru_cache(maxsize=1)
+def _orjson_model() -> Any:
+    """Return a googleapiclient JSON model that (de)serialises bodies with orjson."""
+
+    from googleapiclient.model import JsonModel
+
+    class _OrjsonModel(JsonModel):
+        def serialize(self, body_value: Any) -> str:
+            return orjson.dumps(body_value).decode()
+
+        def deserialize(self, content: bytes | str) -> Any:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return content.decode("utf-8") if isinstance(content, bytes) else content
+
+    return _OrjsonModel()
 
 
 def _main() -> None:  # pragma: no cover - CLI helper
@@ -285,7 +432,7 @@ def _main() -> None:  # pragma: no cover - CLI helper
         print("Authorization successful" if success else "Authorization failed")
     if args.list:
         for item in client._store.list_all():  # noqa: SLF001 - CLI utility
-            print(json.dumps(item, indent=2, ensure_ascii=False))
+            print(orjson.dumps(item, option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI helper
@@ -1,23 +1,64 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Protocol, runtime_checkable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Protocol
 
-from openai import OpenAI, OpenAIError
+from pydantic import TypeAdapter, ValidationError
 
-from app.config import settings
+from app.config import Settings, get_settings
 from app.models import SuggestionPayload
-from app.prompts import SYSTEM, USER_TEMPLATE
+from app.prompts import SYSTEM, render_user
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from openai import AsyncOpenAI, OpenAI
+    from openai.types.responses import ResponseFormatTextJSONSchemaConfigParam
 
 logger = logging.getLogger(__name__)
 
+_SUGGESTION_ADAPTER = TypeAdapter(SuggestionPayload)
+_SYSTEM_MSG: Final = MappingProxyType({"role": "system", "content": SYSTEM})
+
+
+def _strict_json_schema(node: Any) -> Any:
+    """Tighten a pydantic JSON schema to what OpenAI's strict structured output accepts.
+
+    Strict mode wants every property listed as required and no extra properties;
+    optional fields stay nullable via ``anyOf`` and lose their ``default: null``.
+    """
+
+    if isinstance(node, list):
+        return [_strict_json_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    strict = {
+        key: _strict_json_schema(value)
+        for key, value in node.items()
+        if key not in ("properties", "$defs") and not (key == "default" and value is None)
+    }
+    for key in ("properties", "$defs"):
+        if key in node:
+            strict[key] = {name: _strict_json_schema(sub) for name, sub in node[key].items()}
+    if "properties" in node:
+        strict["additionalProperties"] = False
+        strict["required"] = list(node["properties"])
+    return strict
+
+
+# Generated once at import instead of by the SDK on every request.
+_SUGGESTION_TEXT_FORMAT: Final[ResponseFormatTextJSONSchemaConfigParam] = {
+    "type": "json_schema",
+    "name": SuggestionPayload.__name__,
+    "schema": _strict_json_schema(SuggestionPayload.model_json_schema()),
+    "strict": True,
+}
+
 
 class LLMUnavailableError(RuntimeError):
     """Raised when the LLM cannot be reached or used."""
 
 
-@runtime_checkable
 class StructuredLLMProvider(Protocol):
     """Common protocol for structured LLM providers."""
 
@@ -28,13 +69,6 @@ class StructuredLLMProvider(Protocol):
     ) -> SuggestionPayload: ...
 
 
-@dataclass(slots=True)
-class _SuggestContext:
-    instruction: str
-    now_iso: str
-    timezone: str
-
-
 class OfflineLLMProvider:
     """Fallback provider used when credentials are missing."""
 
@@ -49,9 +83,14 @@ class OfflineLLMProvider:
         )
         return SuggestionPayload(candidates=[])
 
+    async def asuggest_events(
+        self, instruction: str, now_iso: str, timezone: str
+    ) -> SuggestionPayload:
+        return self.suggest_events(instruction, now_iso, timezone)
+
 
 class OpenAIProvider:
-    """Structured generation provider backed by OpenAI Responses API."""
+    """Structured generation provider backed by the streaming OpenAI Responses API."""
 
     name = "openai"
 
@@ -63,11 +102,15 @@ class OpenAIProvider:
         model: str,
         temperature: float,
         client: OpenAI | None = None,
+        async_client: AsyncOpenAI | None = None,
         default_headers: dict[str, str] | None = None,
     ) -> None:
+        from openai import AsyncOpenAI, OpenAI, OpenAIError
+
         self._model = model
         self._temperature = temperature
         self._client = client
+        self._async_client = async_client
         if self._client is None:
             try:
                 self._client = OpenAI(
@@ -75,6 +118,13 @@ class OpenAIProvider:
                     base_url=api_host or None,
                     default_headers=default_headers,
                 )
+                if self._async_client is None:
+                    # The SDK's default httpx pool already keeps connections alive.
+                    self._async_client = AsyncOpenAI(
+                        api_key=api_key,
+                        base_url=api_host or None,
+                        default_headers=default_headers,
+                    )
             except OpenAIError as exc:  # pragma: no cover - defensive logging
                 logger.error("Failed to initialise OpenAI client: %s", exc)
                 self._client = None
@@ -85,31 +135,61 @@ class OpenAIProvider:
     def suggest_events(
         self, instruction: str, now_iso: str, timezone: str
     ) -> SuggestionPayload:
-        ctx = _SuggestContext(instruction=instruction, now_iso=now_iso, timezone=timezone)
-        user_prompt = USER_TEMPLATE.format(
-            instruction=ctx.instruction, now=ctx.now_iso, timezone=ctx.timezone
-        )
+        from openai import OpenAIError
 
         try:
-            response = self._client.responses.parse(
-                model=self._model,
-                temperature=self._temperature,
-                max_output_tokens=1200,
-                input=[
-                    {"role": "system", "content": SYSTEM},
-                    {"role": "user", "content": user_prompt},
-                ],
-                text_format=SuggestionPayload,
+            with self._client.responses.stream(
+                **self._request_kwargs(instruction, now_iso, timezone)
+            ) as stream:
+                response = stream.get_final_response()
+        except (OpenAIError, RuntimeError) as exc:  # pragma: no cover - network failure path
+            logger.error("Structured generation failed: %s", exc)
+            raise LLMUnavailableError(str(exc)) from exc
+        return self._unpack(response)
+
+    async def asuggest_events(
+        self, instruction: str, now_iso: str, timezone: str
+    ) -> SuggestionPayload:
+        if self._async_client is None:
+            return await asyncio.to_thread(
+                self.suggest_events, instruction, now_iso, timezone
             )
-        except OpenAIError as exc:  # pragma: no cover - network failure path
+
+        from openai import OpenAIError
+
+        try:
+            async with self._async_client.responses.stream(
+                **self._request_kwargs(instruction, now_iso, timezone)
+            ) as stream:
+                response = await stream.get_final_response()
+        except (OpenAIError, RuntimeError) as exc:  # pragma: no cover - network failure path
             logger.error("Structured generation failed: %s", exc)
             raise LLMUnavailableError(str(exc)) from exc
+        return self._unpack(response)
 
-        if response.output is None or not getattr(response, "output_parsed", None):
+    def _request_kwargs(
+        self, instruction: str, now_iso: str, timezone: str
+    ) -> dict[str, Any]:
+        user_prompt = render_user(instruction, now_iso, timezone)
+        return {
+            "model": self._model,
+            "temperature": self._temperature,
+            "max_output_tokens": 1200,
+            "input": [_SYSTEM_MSG, {"role": "user", "content": user_prompt}],
+            "text": {"format": _SUGGESTION_TEXT_FORMAT},
+        }
+
+    def _unpack(self, response: Any) -> SuggestionPayload:
+        raw = getattr(response, "output_text", None) if response.output else None
+        if not raw:
             logger.warning("LLM returned empty structured payload: %s", response)
             return SuggestionPayload(candidates=[])
 
-        payload: SuggestionPayload = response.output_parsed
+        try:
+            payload = _SUGGESTION_ADAPTER.validate_json(raw)
+        except ValidationError as exc:
+            logger.warning("LLM returned invalid structured payload: %s", exc)
+            return SuggestionPayload(candidates=[])
         logger.debug("Received %d candidates from %s", len(payload.candidates), self.name)
         return payload
 
@@ -139,9 +219,15 @@ class OpenRouterProvider(OpenAIProvider):
 class LLMClient:
     """Wrapper that selects the correct LLM provider at runtime."""
 
-    def __init__(self, provider: StructuredLLMProvider | None = None) -> None:
+    def __init__(
+        self,
+        provider: StructuredLLMProvider | None = None,
+        *,
+        settings: Settings | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
         self._provider = provider or self._build_provider()
-        self._provider_name = getattr(self._provider, "name", "unknown")
+        self._provider_name = self._provider.name
 
     def suggest_events(
         self, instruction: str, now_iso: str, timezone: str
@@ -154,8 +240,25 @@ class LLMClient:
             )
             return SuggestionPayload(candidates=[])
 
+    async def asuggest_events(
+        self, instruction: str, now_iso: str, timezone: str
+    ) -> SuggestionPayload:
+        asuggest = getattr(self._provider, "asuggest_events", None)
+        try:
+            if asuggest is None:
+                return await asyncio.to_thread(
+                    self._provider.suggest_events, instruction, now_iso, timezone
+                )
+            return await asuggest(instruction, now_iso, timezone)
+        except LLMUnavailableError as exc:
+            logger.warning(
+                "LLM provider '%s' unavailable: %s", self._provider_name, exc
+            )
+            return SuggestionPayload(candidates=[])
+
     # ----------------------------------------------------------------- internals
     def _build_provider(self) -> StructuredLLMProvider:
+        settings = self._settings
         provider_key = (settings.llm_provider or "openai").lower()
         if provider_key == "openai":
             api_key = settings.openai_api_key
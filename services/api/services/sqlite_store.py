@@ -1,13 +1,98 @@
 from __future__ import annotations
 
-import json
 import sqlite3
-from datetime import datetime, timezone
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Sequence
 from uuid import uuid4
 
+import orjson
+
 from app.models import CalendarEvent
+from app.utils.time import parse_iso_datetime
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Connection tuning plus DDL, applied in one script when the store opens.
+# PRAGMAs come first: journal_mode cannot change inside a transaction.
+_SCHEMA_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA mmap_size=134217728;
+BEGIN;
+CREATE TABLE IF NOT EXISTS tokens (
+    provider TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS events (%(events_columns)s);
+CREATE INDEX IF NOT EXISTS events_start_end_idx ON events(start_ts, end_ts);
+PRAGMA user_version=%(version)d;
+COMMIT;
+"""
+# start_ts/end_ts hold integer microseconds since the Unix epoch (UTC).
+_EVENTS_COLUMNS = """
+    event_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    start_iso TEXT NOT NULL,
+    end_iso TEXT NOT NULL,
+    start_ts INTEGER NOT NULL,
+    end_ts INTEGER NOT NULL,
+    payload_json BLOB NOT NULL,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+"""
+SCHEMA_VERSION = 1
+_SCHEMA_SQL %= {"events_columns": _EVENTS_COLUMNS, "version": SCHEMA_VERSION}
+# Version 0 stored REAL seconds; rebuild the table so the columns get INTEGER affinity.
+# Run statement by statement inside BEGIN IMMEDIATE so the version can be re-checked
+# under the write lock; the version stamp commits together with the rebuilt table.
+_MIGRATE_V1_SQL = (
+    f"CREATE TABLE events_v1 ({_EVENTS_COLUMNS})",
+    """
+    INSERT INTO events_v1
+    SELECT event_id, title, start_iso, end_iso,
+           CAST(round(start_ts * 1000000) AS INTEGER),
+           CAST(round(end_ts * 1000000) AS INTEGER),
+           payload_json, updated_at
+    FROM events
+    """,
+    "DROP TABLE events",
+    "ALTER TABLE events_v1 RENAME TO events",
+    "PRAGMA user_version=1",
+)
+_BUSY_TIMEOUT_SQL = "PRAGMA busy_timeout=5000"
+_USER_VERSION_SQL = "PRAGMA user_version"
+_HAS_EVENTS_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events'"
+_SAVE_TOKEN_SQL = (
+    "INSERT INTO tokens(provider, data, updated_at) "
+    "VALUES(?, ?, CURRENT_TIMESTAMP) "
+    "ON CONFLICT(provider) DO UPDATE SET "
+    "data=excluded.data, updated_at=CURRENT_TIMESTAMP"
+)
+_LOAD_TOKEN_SQL = "SELECT data FROM tokens WHERE provider = ?"
+_UPSERT_EVENT_SQL = (
+    "INSERT INTO events(event_id, title, start_iso, end_iso, start_ts, end_ts, payload_json, updated_at) "
+    "VALUES(?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP) "
+    "ON CONFLICT(event_id) DO UPDATE SET "
+    "title=excluded.title, start_iso=excluded.start_iso, end_iso=excluded.end_iso, "
+    "start_ts=excluded.start_ts, end_ts=excluded.end_ts, payload_json=excluded.payload_json, "
+    "updated_at=CURRENT_TIMESTAMP"
+)
+_LIST_BETWEEN_SQL = (
+    "SELECT payload_json FROM events "
+    "WHERE start_ts < ? AND end_ts > ? "
+    "ORDER BY start_ts"
+)
+_LIST_ALL_SQL = "SELECT payload_json FROM events ORDER BY start_ts"
+_LITE_COLUMNS = frozenset(
+    {"event_id", "title", "start_iso", "end_iso", "start_ts", "end_ts", "updated_at"}
+)
 
 
 def _ensure_parent(path: Path) -> None:
@@ -15,21 +100,23 @@ def _ensure_parent(path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _iso_to_timestamp(value: str) -> float:
-    iso_value = value.replace("Z", "+00:00")
-    dt = datetime.fromisoformat(iso_value)
+@lru_cache(maxsize=4096)
+def _iso_to_timestamp(value: str) -> int:
+    """Return ``value`` as integer microseconds since the epoch; naive values are UTC."""
+
+    dt = parse_iso_datetime(value)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    return dt.timestamp()
+    return (dt - _EPOCH) // _MICROSECOND
 
 
 def _coerce_iso(payload: Any) -> str | None:
-    if isinstance(payload, dict):
+    # Payloads come straight from JSON decoding, so exact type checks suffice.
+    kind = type(payload)
+    if kind is dict:
         candidate = payload.get("dateTime") or payload.get("date")
-        if isinstance(candidate, str):
-            return candidate
-        return None
-    if isinstance(payload, str):
+        return candidate if type(candidate) is str else None
+    if kind is str:
         return payload
     return None
 
@@ -40,41 +127,63 @@ class CalendarSQLiteStore:
     def __init__(self, db_path: str) -> None:
         self.path = Path(db_path)
         _ensure_parent(self.path)
-        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, cached_statements=256
+        )
         self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        self._tx_depth = 0
         self._ensure_schema()
 
+    # ------------------------------------------------------------- transaction
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into a single transaction; nested calls join the outer one."""
+
+        with self._lock:
+            if self._tx_depth:
+                self._tx_depth += 1
+                try:
+                    yield
+                finally:
+                    self._tx_depth -= 1
+                return
+            self._tx_depth = 1
+            try:
+                with self._conn:
+                    yield
+            finally:
+                self._tx_depth = 0
+
     # ------------------------------------------------------------------ tokens
     def save_token(self, provider: str, data: str) -> None:
-        with self._conn:
-            self._conn.execute(
-                (
-                    "INSERT INTO tokens(provider, data, updated_at) "
-                    "VALUES(?, ?, CURRENT_TIMESTAMP) "
-                    "ON CONFLICT(provider) DO UPDATE SET "
-                    "data=excluded.data, updated_at=CURRENT_TIMESTAMP"
-                ),
-                (provider, data),
-            )
+        with self.transaction():
+            self._conn.execute(_SAVE_TOKEN_SQL, (provider, data))
 
     def load_token(self, provider: str) -> str | None:
-        cur = self._conn.execute(
-            "SELECT data FROM tokens WHERE provider = ?", (provider,)
-        )
+        cur = self._conn.execute(_LOAD_TOKEN_SQL, (provider,))
         row = cur.fetchone()
         return row["data"] if row else None
 
     # ------------------------------------------------------------------ events
     def save_calendar_event(self, event_id: str, event: CalendarEvent) -> None:
-        payload = event.model_dump(mode="json")
-        payload.setdefault("id", event_id)
-        self._persist_payload(
-            event_id,
-            title=event.title,
-            start_iso=event.start.isoformat(),
-            end_iso=event.end.isoformat(),
-            payload=payload,
-        )
+        self.save_calendar_events([(event_id, event)])
+
+    def save_calendar_events(self, items: Sequence[tuple[str, CalendarEvent]]) -> None:
+        """Upsert ``(event_id, event)`` pairs with one ``executemany`` in one transaction."""
+
+        rows = [
+            _event_row(
+                event_id,
+                event.title,
+                event.start.isoformat(),
+                event.end.isoformat(),
+                _event_payload(event_id, event),
+            )
+            for event_id, event in items
+        ]
+        with self.transaction():
+            self._conn.executemany(_UPSERT_EVENT_SQL, rows)
 
     def save_payload(self, event_id: str | None, payload: dict[str, Any]) -> None:
         event_id = event_id or f"payload-{uuid4().hex}"
@@ -88,26 +197,34 @@ class CalendarSQLiteStore:
             or payload.get("description")
             or event_id
         )
-        payload = dict(payload)
-        payload.setdefault("id", event_id)
+        if "id" not in payload:
+            payload = {**payload, "id": event_id}
         self._persist_payload(event_id, title, start_iso, end_iso, payload)
 
     def list_between(self, time_min_iso: str, time_max_iso: str) -> list[dict[str, Any]]:
-        start_ts = _iso_to_timestamp(time_min_iso.replace("Z", "+00:00"))
-        end_ts = _iso_to_timestamp(time_max_iso.replace("Z", "+00:00"))
+        start_ts = _iso_to_timestamp(time_min_iso)
+        end_ts = _iso_to_timestamp(time_max_iso)
+        cur = self._conn.execute(_LIST_BETWEEN_SQL, (end_ts, start_ts))
+        return [orjson.loads(row["payload_json"]) for row in cur.fetchall()]
+
+    def list_between_lite(
+        self,
+        time_min_iso: str,
+        time_max_iso: str,
+        cols: Sequence[str] = ("event_id", "title", "start_iso", "end_iso"),
+    ) -> list[dict[str, Any]]:
+        """Like :meth:`list_between`, but return only indexed columns, skipping payload decoding."""
+
+        cols = tuple(cols)
+        sql = _list_between_lite_sql(cols)
         cur = self._conn.execute(
-            (
-                "SELECT payload_json FROM events "
-                "WHERE start_ts < ? AND end_ts > ? "
-                "ORDER BY start_ts"
-            ),
-            (end_ts, start_ts),
+            sql, (_iso_to_timestamp(time_max_iso), _iso_to_timestamp(time_min_iso))
         )
-        return [json.loads(row["payload_json"]) for row in cur.fetchall()]
+        return [dict(zip(cols, row, strict=True)) for row in cur.fetchall()]
 
     def list_all(self) -> list[dict[str, Any]]:
-        cur = self._conn.execute("SELECT payload_json FROM events ORDER BY start_ts")
-        return [json.loads(row["payload_json"]) for row in cur.fetchall()]
+        cur = self._conn.execute(_LIST_ALL_SQL)
+        return [orjson.loads(row["payload_json"]) for row in cur.fetchall()]
 
     # -------------------------------------------------------------------- utils
     def close(self) -> None:
@@ -116,37 +233,36 @@ class CalendarSQLiteStore:
         except Exception:  # pragma: no cover - defensive
             pass
 
-    def __del__(self) -> None:  # pragma: no cover - best effort cleanup
-        try:
-            self.close()
-        except Exception:
-            pass
+    def __enter__(self) -> CalendarSQLiteStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _ensure_schema(self) -> None:
-        with self._conn:
-            self._conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS tokens (
-                    provider TEXT PRIMARY KEY,
-                    data TEXT NOT NULL,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-            self._conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS events (
-                    event_id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    start_iso TEXT NOT NULL,
-                    end_iso TEXT NOT NULL,
-                    start_ts REAL NOT NULL,
-                    end_ts REAL NOT NULL,
-                    payload_json TEXT NOT NULL,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
+        with self._lock:
+            # Set before migrating so a concurrent opener waits instead of failing.
+            self._conn.execute(_BUSY_TIMEOUT_SQL)
+            if self._needs_v1_migration():
+                self._migrate_v1()
+            self._conn.executescript(_SCHEMA_SQL)
+
+    def _needs_v1_migration(self) -> bool:
+        version = self._conn.execute(_USER_VERSION_SQL).fetchone()[0]
+        return version < 1 and self._conn.execute(_HAS_EVENTS_SQL).fetchone() is not None
+
+    def _migrate_v1(self) -> None:
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the write lock.
+            if self._needs_v1_migration():
+                for statement in _MIGRATE_V1_SQL:
+                    conn.execute(statement)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
 
     def _persist_payload(
         self,
@@ -156,26 +272,45 @@ class CalendarSQLiteStore:
         end_iso: str,
         payload: dict[str, Any],
     ) -> None:
-        start_ts = _iso_to_timestamp(start_iso)
-        end_ts = _iso_to_timestamp(end_iso)
-        with self._conn:
-            self._conn.execute(
-                (
-                    "INSERT INTO events(event_id, title, start_iso, end_iso, start_ts, end_ts, payload_json, updated_at) "
-                    "VALUES(?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP) "
-                    "ON CONFLICT(event_id) DO UPDATE SET "
-                    "title=excluded.title, start_iso=excluded.start_iso, end_iso=excluded.end_iso, "
-                    "start_ts=excluded.start_ts, end_ts=excluded.end_ts, payload_json=excluded.payload_json, "
-                    "updated_at=CURRENT_TIMESTAMP"
-                ),
-                (
-                    event_id,
-                    title,
-                    start_iso,
-                    end_iso,
-                    start_ts,
-                    end_ts,
-                    json.dumps(payload, default=str),
-                ),
-            )
+        row = _event_row(
+            event_id, title, start_iso, end_iso, orjson.dumps(payload, default=str)
+        )
+        with self.transaction():
+            self._conn.execute(_UPSERT_EVENT_SQL, row)
+
+
+@lru_cache(maxsize=32)
+def _list_between_lite_sql(cols: tuple[str, ...]) -> str:
+    unknown = set(cols) - _LITE_COLUMNS
+    if unknown or not cols:
+        raise ValueError(f"Unsupported columns for list_between_lite: {sorted(unknown)}")
+    return (
+        f"SELECT {', '.join(cols)} FROM events "
+        "WHERE start_ts < ? AND end_ts > ? "
+        "ORDER BY start_ts"
+    )
+
+
+def _event_payload(event_id: str, event: CalendarEvent) -> bytes:
+    # Serialise straight to JSON bytes in pydantic-core. CalendarEvent has no
+    # ``id`` field, so the id is spliced in as the first key.
+    body = event.__pydantic_serializer__.to_json(event)
+    return b'{"id":' + orjson.dumps(event_id) + b"," + body[1:]
+
 
+def _event_row(
+    event_id: str,
+    title: str,
+    start_iso: str,
+    end_iso: str,
+    payload: bytes,
+) -> tuple[Any, ...]:
+    return (
+        event_id,
+        title,
+        start_iso,
+        end_iso,
+        _iso_to_timestamp(start_iso),
+        _iso_to_timestamp(end_iso),
+        payload,
+    )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import uuid
+import os
 from datetime import datetime
+from functools import lru_cache
 
+from app.config import Settings
 from app.models import (
     CalendarEvent,
     CommitPlan,
@@ -15,8 +18,8 @@ from app.models import (
 from app.services.calendar_client import ICalendarClient
 from app.services.google_calendar import GoogleCalendarClient
 from app.services.llm_client import LLMClient, LLMUnavailableError
-from app.utils.repair import normalize_event
-from app.utils.time import now_in_tz
+from app.utils.repair import normalize_event, shift_to_free_slot
+from app.utils.time import now_in_tz, parse_iso_datetime
 
 logger = logging.getLogger(__name__)
 
@@ -24,18 +27,21 @@ logger = logging.getLogger(__name__)
 class SGRController:
     """Structured Generation & Repair loop orchestrator."""
 
+    __slots__ = ("llm", "calendar")
+
     def __init__(
         self,
         *,
         llm: LLMClient | None = None,
         calendar: ICalendarClient | None = None,
+        settings: Settings | None = None,
     ) -> None:
-        self.llm = llm or LLMClient()
-        self.calendar = calendar or GoogleCalendarClient()
+        self.llm = llm or LLMClient(settings=settings)
+        self.calendar = calendar or GoogleCalendarClient(settings=settings)
 
     # ------------------------------------------------------------------ Suggest
     def suggest(self, req: SuggestEventsRequest) -> SuggestEventsResponse:
-        trace_id = str(uuid.uuid4())
+        trace_id = os.urandom(16).hex()
         now_iso = (req.now or now_in_tz(req.timezone)).isoformat()
 
         try:
@@ -44,20 +50,85 @@ class SGRController:
             logger.warning("LLM unavailable, returning empty suggestions: %s", exc)
             payload = SuggestionPayload(candidates=[])
 
-        candidates = [self._repair_candidate(ev, req.timezone) for ev in payload.candidates]
-        return SuggestEventsResponse(candidates=candidates, trace_id=trace_id)
+        return self._build_response(payload, req.timezone, trace_id)
+
+    async def asuggest(self, req: SuggestEventsRequest) -> SuggestEventsResponse:
+        """Async variant of :meth:`suggest` that keeps the event loop free."""
+
+        trace_id = os.urandom(16).hex()
+        now_iso = (req.now or now_in_tz(req.timezone)).isoformat()
+
+        asuggest_events = getattr(self.llm, "asuggest_events", None)
+        try:
+            if asuggest_events is None:
+                payload = await asyncio.to_thread(
+                    self.llm.suggest_events, req.instruction, now_iso, req.timezone
+                )
+            else:
+                payload = await asuggest_events(req.instruction, now_iso, req.timezone)
+        except LLMUnavailableError as exc:
+            logger.warning("LLM unavailable, returning empty suggestions: %s", exc)
+            payload = SuggestionPayload(candidates=[])
+
+        # Busy-slot lookups hit the (blocking) calendar client.
+        return await asyncio.to_thread(
+            self._build_response, payload, req.timezone, trace_id
+        )
+
+    def _build_response(
+        self, payload: SuggestionPayload, timezone: str, trace_id: str
+    ) -> SuggestEventsResponse:
+        normalized = [normalize_event(ev, timezone=timezone) for ev in payload.candidates]
+        # One calendar query covers the whole candidate window; slots are
+        # then filtered locally per candidate.
+        busy_slots = self._busy_slots(normalized)
+        candidates = [self._repair_candidate(ev, busy_slots) for ev in normalized]
+        # Candidates are CalendarEvent instances validated by normalize_event.
+        return SuggestEventsResponse.model_construct(candidates=candidates, trace_id=trace_id)
 
     # ------------------------------------------------------------------- Commit
     def commit(self, plan: CommitPlan) -> CommitResult:
         created = updated = skipped = 0
         errors: list[str] = []
 
+        # Clients exposing ``bulk_create``/``bulk_update`` get all creates and
+        # updates in batched requests instead of one round-trip per item.
+        bulk_create = getattr(self.calendar, "bulk_create", None)
+        creates = [item.event for item in plan.items if item.decision.kind == "create"]
+        batch_creates = bulk_create is not None and len(creates) > 1
+        if batch_creates:
+            try:
+                bulk_create(creates)
+                created += len(creates)
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.exception("Commit error")
+                errors.append(str(exc))
+
+        bulk_update = getattr(self.calendar, "bulk_update", None)
+        updates = [
+            (item.event.source or item.event.title, item.event)
+            for item in plan.items
+            if item.decision.kind == "update"
+        ]
+        batch_updates = bulk_update is not None and len(updates) > 1
+        if batch_updates:
+            try:
+                bulk_update(updates)
+                updated += len(updates)
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.exception("Commit error")
+                errors.append(str(exc))
+
         for item in plan.items:
             try:
                 if item.decision.kind == "create":
+                    if batch_creates:
+                        continue
                     self.calendar.create_event(item.event)
                     created += 1
                 elif item.decision.kind == "update":
+                    if batch_updates:
+                        continue
                     event_id = item.event.source or item.event.title
                     self.calendar.update_event(event_id, item.event)
                     updated += 1
@@ -75,33 +146,45 @@ class SGRController:
             trace_id=plan.trace_id,
         )
 
+    async def acommit(self, plan: CommitPlan) -> CommitResult:
+        """Async variant of :meth:`commit`; calendar calls run in a worker thread."""
+
+        return await asyncio.to_thread(self.commit, plan)
+
     # ----------------------------------------------------------------- Internals
-    def _repair_candidate(self, event: CalendarEvent, timezone: str) -> CalendarEvent:
-        base = normalize_event(event, timezone=timezone)
-        busy_slots = self._busy_slots(base)
-        if busy_slots:
-            base = normalize_event(base, timezone=base.timezone, existing_busy=busy_slots)
-        return base
-
-    def _busy_slots(self, event: CalendarEvent) -> list[tuple[datetime, datetime]]:
-        if not event.start or not event.end:
+    def _repair_candidate(
+        self,
+        event: CalendarEvent,
+        busy_slots: list[tuple[datetime, datetime]],
+    ) -> CalendarEvent:
+        if any(start < event.end and end > event.start for start, end in busy_slots):
+            # Shift against the whole window so the move cannot land on a
+            # slot that belongs to a neighbouring candidate's range.
+            return shift_to_free_slot(event, busy_slots)
+        return event
+
+    def _busy_slots(self, events: list[CalendarEvent]) -> list[tuple[datetime, datetime]]:
+        events = [ev for ev in events if ev.start and ev.end]
+        if not events:
             return []
 
+        time_min = min(ev.start for ev in events)
+        time_max = max(ev.end for ev in events)
         try:
-            raw = self.calendar.list_between(event.start.isoformat(), event.end.isoformat())
+            raw = self.calendar.list_between(time_min.isoformat(), time_max.isoformat())
         except Exception as exc:  # pragma: no cover - external API failure path
             logger.warning("Failed to fetch busy slots: %s", exc)
             return []
 
-        tzinfo = event.start.tzinfo or event.end.tzinfo
-        return [
+        tzinfo = time_min.tzinfo or time_max.tzinfo
+        return sorted(
             slot
             for slot in (
                 self._parse_slot(item, tzinfo)
                 for item in raw
             )
             if slot is not None
-        ]
+        )
 
     @staticmethod
     def _parse_slot(
@@ -122,12 +205,20 @@ def _coerce_datetime(value, tzinfo) -> datetime | None:
     if isinstance(value, dict):
         value = value.get("dateTime") or value.get("date")
     if isinstance(value, str):
-        iso_value = value.replace("Z", "+00:00")
-        try:
-            dt = datetime.fromisoformat(iso_value)
-        except ValueError:
+        dt = _parse_iso(value)
+        if dt is None:
             return None
         if dt.tzinfo is None and tzinfo is not None:
             dt = dt.replace(tzinfo=tzinfo)
         return dt
     return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime | None:
+    # Busy-slot timestamps repeat heavily across suggest calls; datetimes
+    # are immutable so cached results can be shared.
+    try:
+        return parse_iso_datetime(value)
+    except ValueError:
+        return None
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Iterable, Sequence, Union
+from typing import Sequence, Union
 
 import zoneinfo
-from zoneinfo import ZoneInfoNotFoundError
+from pydantic import TypeAdapter
 
-from app.models import Attendee, CalendarEvent, EventDraft, Reminder, Recurrence
-from app.utils.time import DEFAULT_TZ
+from app.models import DEFAULT_REMINDERS, Attendee, CalendarEvent, EventDraft, Reminder, Recurrence
+from app.utils.time import DEFAULT_TZ, get_zoneinfo
 
 DEFAULT_EVENT_DURATION = timedelta(hours=1)
 CONFLICT_SHIFT = timedelta(minutes=15)
@@ -15,6 +16,10 @@ MAX_SHIFT_ATTEMPTS = 8
 
 EventLike = Union[CalendarEvent, EventDraft]
 
+# Validate whole lists in one pass; model instances are passed through as-is.
+_ATTENDEE_LIST = TypeAdapter(list[Attendee])
+_REMINDER_LIST = TypeAdapter(list[Reminder])
+
 
 def normalize_event(
     event: EventLike,
@@ -24,55 +29,38 @@ def normalize_event(
 ) -> CalendarEvent:
     """Apply SGR repair policies to keep events consistent."""
 
-    draft = event.model_copy(deep=True)
-    tz_name = timezone or getattr(draft, "timezone", None) or DEFAULT_TZ
-    setattr(draft, "timezone", tz_name)
-
-    try:
-        tz = zoneinfo.ZoneInfo(tz_name)
-    except ZoneInfoNotFoundError:
-        tz = zoneinfo.ZoneInfo(DEFAULT_TZ)
-        setattr(draft, "timezone", DEFAULT_TZ)
+    tz = get_zoneinfo(timezone or getattr(event, "timezone", None) or DEFAULT_TZ)
+    tz_name = tz.key  # DEFAULT_TZ when the requested zone is unknown
 
-    start = _ensure_timezone(getattr(draft, "start"), tz)
-    end = _ensure_timezone(getattr(draft, "end"), tz)
+    start = _ensure_timezone(getattr(event, "start"), tz)
+    end = _ensure_timezone(getattr(event, "end"), tz)
     if end <= start:
         end = start + DEFAULT_EVENT_DURATION
 
-    attendees = [
-        attendee
-        if isinstance(attendee, Attendee)
-        else Attendee.model_validate(attendee)
-        for attendee in getattr(draft, "attendees", [])
-    ]
-
-    reminders = [
-        reminder
-        if isinstance(reminder, Reminder)
-        else Reminder.model_validate(reminder)
-        for reminder in getattr(draft, "reminders", [])
-    ] or [Reminder()]
-
-    recurrence = getattr(draft, "recurrence", None)
+    attendees = _ATTENDEE_LIST.validate_python(getattr(event, "attendees", []))
+    reminders = _REMINDER_LIST.validate_python(getattr(event, "reminders", []))
+    if not reminders:
+        reminders = list(DEFAULT_REMINDERS)
+
+    recurrence = getattr(event, "recurrence", None)
     if recurrence and not isinstance(recurrence, Recurrence):
         recurrence = Recurrence.model_validate(recurrence)
 
     normalized = CalendarEvent(
-        title=getattr(draft, "title"),
-        description=getattr(draft, "description", None),
+        title=getattr(event, "title"),
+        description=getattr(event, "description", None),
         start=start,
         end=end,
-        timezone=getattr(draft, "timezone"),
-        location=getattr(draft, "location", None),
+        timezone=tz_name,
+        location=getattr(event, "location", None),
         attendees=attendees,
         reminders=reminders,
         recurrence=recurrence,
-        source=getattr(draft, "source", None),
+        source=getattr(event, "source", None),
     )
 
-    busy_slots = list(existing_busy or ())
-    if busy_slots:
-        normalized = _shift_to_free_slot(normalized, busy_slots)
+    if existing_busy:
+        normalized = shift_to_free_slot(normalized, existing_busy)
 
     return normalized
 
@@ -83,22 +71,50 @@ def _ensure_timezone(dt: datetime, tz: zoneinfo.ZoneInfo) -> datetime:
     return dt.astimezone(tz)
 
 
-def _shift_to_free_slot(event: CalendarEvent, busy_slots: Sequence[tuple[datetime, datetime]]) -> CalendarEvent:
-    ev = event.model_copy(deep=True)
+def shift_to_free_slot(
+    event: CalendarEvent, busy_slots: Sequence[tuple[datetime, datetime]]
+) -> CalendarEvent:
+    """Move ``event`` forward in ``CONFLICT_SHIFT`` steps until it avoids ``busy_slots``."""
+
+    starts, ends = _merge_busy(busy_slots)
+    if not _has_conflict(event.start, event.end, starts, ends):
+        return event
+
+    start, end = event.start, event.end
     for _ in range(MAX_SHIFT_ATTEMPTS):
-        if not _has_conflict(ev.start, ev.end, busy_slots):
-            return ev
-        ev.start += CONFLICT_SHIFT
-        ev.end += CONFLICT_SHIFT
-    return ev
+        if not _has_conflict(start, end, starts, ends):
+            break
+        start += CONFLICT_SHIFT
+        end += CONFLICT_SHIFT
+    return event.model_copy(update={"start": start, "end": end})
+
+
+def _merge_busy(
+    busy_slots: Sequence[tuple[datetime, datetime]],
+) -> tuple[list[datetime], list[datetime]]:
+    """Sort ``busy_slots`` and coalesce overlapping ones into parallel start/end lists.
+
+    Touching slots stay separate so a zero-length event between them is free.
+    """
+
+    starts: list[datetime] = []
+    ends: list[datetime] = []
+    for busy_start, busy_end in sorted(busy_slots):
+        if ends and busy_start < ends[-1]:
+            ends[-1] = max(ends[-1], busy_end)
+        else:
+            starts.append(busy_start)
+            ends.append(busy_end)
+    return starts, ends
 
 
 def _has_conflict(
     start: datetime,
     end: datetime,
-    busy_slots: Iterable[tuple[datetime, datetime]],
+    starts: Sequence[datetime],
+    ends: Sequence[datetime],
 ) -> bool:
-    for busy_start, busy_end in busy_slots:
-        if start < busy_end and end > busy_start:
-            return True
-    return False
+    # Slots are disjoint and sorted, so only the last one starting before
+    # ``end`` can overlap.
+    idx = bisect_left(starts, end)
+    return idx > 0 and ends[idx - 1] > start
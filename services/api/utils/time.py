@@ -1,8 +1,34 @@
 from __future__ import annotations
+import logging
+import os
 from datetime import datetime
+from functools import lru_cache
 import zoneinfo
+from zoneinfo import ZoneInfoNotFoundError
+
+try:  # optional C parser, noticeably faster than the stdlib one
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:  # pragma: no cover - depends on installed extras
+    # Python 3.11+ accepts the trailing "Z" natively.
+    parse_iso_datetime = datetime.fromisoformat
 
 DEFAULT_TZ = "Europe/Riga"
 
+logger = logging.getLogger(__name__)
+
+def _resolve_zone(name: str) -> zoneinfo.ZoneInfo:
+    """Return the zone for ``name``, falling back to ``DEFAULT_TZ`` when unknown."""
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except ZoneInfoNotFoundError:
+        logger.warning("Unknown timezone %r; falling back to %s", name, DEFAULT_TZ)
+        return zoneinfo.ZoneInfo(DEFAULT_TZ)
+
+# Memoised (including the not-found fallback); SGR_TZ_CACHE=0 disables it for profiling.
+if os.getenv("SGR_TZ_CACHE", "1") == "0":
+    get_zoneinfo = _resolve_zone
+else:
+    get_zoneinfo = lru_cache(maxsize=512)(_resolve_zone)
+
 def now_in_tz(tz: str = DEFAULT_TZ) -> datetime:
-    return datetime.now(tz=zoneinfo.ZoneInfo(tz))
+    return datetime.now(tz=get_zoneinfo(tz))
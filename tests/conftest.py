@@ -1,5 +1,7 @@
+import socket
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -17,55 +19,82 @@ def docker_ip():
     return "localhost"
 
 
+SERVICE_TIMEOUT = 30.0  # seconds each service may take to become ready
+POLL_INTERVAL = 0.05
+
+
+def _wait_tcp(host, port, timeout=SERVICE_TIMEOUT, interval=POLL_INTERVAL):
+    """Block until ``host:port`` accepts TCP connections; return False on timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return True
+        except OSError:
+            time.sleep(interval)
+    return False
+
+
+def _wait_ready(name, host, port, ping):
+    """Wait for the port, then retry the protocol-level ``ping`` until it succeeds."""
+    deadline = time.monotonic() + SERVICE_TIMEOUT
+    if _wait_tcp(host, port, timeout=SERVICE_TIMEOUT):
+        while time.monotonic() < deadline:
+            try:
+                if ping():
+                    return
+            except Exception:
+                pass
+            time.sleep(POLL_INTERVAL)
+    raise RuntimeError(f"{name} did not start in time")
+
+
+def _ping_postgres(host):
+    import psycopg
+    conn = psycopg.connect(
+        host=host,
+        port=5432,
+        user="app",
+        password="app",
+        dbname="calendar_ai",
+        connect_timeout=2,
+    )
+    conn.close()
+    return True
+
+
+def _ping_redis(host):
+    import redis
+    r = redis.Redis(host=host, port=6379, socket_connect_timeout=2)
+    return r.ping()
+
+
+def _ping_opensearch(host):
+    import requests
+    resp = requests.get(f"http://{host}:9200", timeout=2)
+    return resp.status_code == 200
+
+
 @pytest.fixture(scope="session")
 def docker_services(docker_ip):
     """Wait for Docker services to be ready.
 
     This is a simple fixture - you may want to use testcontainers-docker
-    or pytest-docker for more robust testing.
+    or pytest-docker for more robust testing. The services are polled
+    concurrently, so startup waits for the slowest one only.
     """
-    # Wait for PostgreSQL
-    for _ in range(30):
-        try:
-            import psycopg
-            conn = psycopg.connect(
-                host=docker_ip,
-                port=5432,
-                user="app",
-                password="app",
-                dbname="calendar_ai",
-                connect_timeout=2,
-            )
-            conn.close()
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        raise RuntimeError("PostgreSQL did not start in time")
-
-    # Wait for Redis
-    for _ in range(30):
-        try:
-            import redis
-            r = redis.Redis(host=docker_ip, port=6379, socket_connect_timeout=2)
-            r.ping()
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        raise RuntimeError("Redis did not start in time")
-
-    # Wait for OpenSearch
-    for _ in range(30):
-        try:
-            import requests
-            resp = requests.get(f"http://{docker_ip}:9200", timeout=2)
-            if resp.status_code == 200:
-                break
-        except Exception:
-            time.sleep(1)
-    else:
-        raise RuntimeError("OpenSearch did not start in time")
+    checks = [
+        ("PostgreSQL", 5432, _ping_postgres),
+        ("Redis", 6379, _ping_redis),
+        ("OpenSearch", 9200, _ping_opensearch),
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [
+            pool.submit(_wait_ready, name, docker_ip, port, lambda ping=ping: ping(docker_ip))
+            for name, port, ping in checks
+        ]
+        for future in futures:
+            future.result()
 
     yield
 
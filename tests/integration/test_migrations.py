@@ -134,7 +134,7 @@ def test_insert_and_select_embedding(clean_db):
 
     clean_db.execute(text(f"""
         INSERT INTO embeddings (document_id, embedding, model_version)
-        VALUES ({doc_id}, '{embedding_str}'::vector(384), 'bge-small')
+        VALUES ({doc_id}, '{embedding_str}'::halfvec(384), 'bge-small')
     """))
     clean_db.commit()
 
@@ -151,8 +151,8 @@ def test_insert_and_select_embedding(clean_db):
     assert row[1] == "bge-small", "Model version should match"
 
 
-def test_ivfflat_index_exists(clean_db):
-    """Test that ivfflat index is created."""
+def test_hnsw_index_exists(clean_db):
+    """Test that HNSW index is created."""
     # Apply migration
     from migrations.env import run_migrations_online
     from alembic.config import Config
@@ -163,9 +163,10 @@ def test_ivfflat_index_exists(clean_db):
 
     # Check index exists
     result = clean_db.execute(text("""
-        SELECT indexname
+        SELECT indexdef
         FROM pg_indexes
         WHERE schemaname = 'public' AND indexname = 'embeddings_embedding_idx'
     """))
     rows = result.fetchall()
-    assert len(rows) == 1, "ivfflat index should exist"
+    assert len(rows) == 1, "HNSW index should exist"
+    assert "USING hnsw" in rows[0][0], "Vector index should use HNSW"
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import sqlite3
+import time
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+import orjson
+import pytest
+from config import Settings
 from models import CalendarEvent, Reminder
-from services.google_calendar import GoogleCalendarClient
+from services.google_calendar import (
+    _CREDS_CACHE,
+    TOKEN_PROVIDER,
+    GoogleCalendarClient,
+    GoogleOAuthManager,
+    _orjson_model,
+    _read_possible_json,
+)
 from services.sqlite_store import CalendarSQLiteStore
 
 
@@ -22,38 +34,293 @@ def _sample_event() -> CalendarEvent:
 
 
 def test_sqlite_store_roundtrip(tmp_path) -> None:
-    store = CalendarSQLiteStore(str(tmp_path / "calendar.db"))
-    event = _sample_event()
-    store.save_calendar_event("evt-1", event)
-    events = store.list_between(
-        (event.start - timedelta(minutes=30)).isoformat(),
-        (event.end + timedelta(minutes=30)).isoformat(),
-    )
-    assert events
-    assert events[0]["title"] == "Daily standup"
-    assert events[0]["id"] == "evt-1"
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        event = _sample_event()
+        store.save_calendar_event("evt-1", event)
+        events = store.list_between(
+            (event.start - timedelta(minutes=30)).isoformat(),
+            (event.end + timedelta(minutes=30)).isoformat(),
+        )
+        assert events
+        assert events[0]["title"] == "Daily standup"
+        assert events[0]["id"] == "evt-1"
 
 
 def test_google_client_dry_run_persists(tmp_path) -> None:
-    store = CalendarSQLiteStore(str(tmp_path / "calendar.db"))
-    client = GoogleCalendarClient(store=store)
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        client = GoogleCalendarClient(store=store)
+
+        assert client.dry_run
+
+        event = _sample_event()
+        event_id = client.create_event(event)
+
+        assert event_id.startswith("dry-run-") or event_id == "dry-run-id"
+
+        listings = client.list_between(
+            (event.start - timedelta(minutes=30)).isoformat(),
+            (event.end + timedelta(minutes=30)).isoformat(),
+        )
+        assert listings
+        assert any(item.get("title") == "Daily standup" for item in listings)
+
+
+def test_store_token_roundtrip(tmp_path) -> None:
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        store.save_token("google", "{\"token\": \"value\"}")
+        assert store.load_token("google") == "{\"token\": \"value\"}"
+
 
-    assert client.dry_run
+def test_store_transaction_rolls_back_grouped_writes(tmp_path) -> None:
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        event = _sample_event()
+
+        try:
+            with store.transaction():
+                store.save_calendar_event("evt-1", event)
+                with store.transaction():  # nested calls join the outer transaction
+                    store.save_calendar_event("evt-2", event)
+                raise RuntimeError("abort batch")
+        except RuntimeError:
+            pass
+
+        assert store.list_all() == []
+
+        with store.transaction():
+            store.save_calendar_event("evt-1", event)
+            store.save_calendar_event("evt-2", event)
+        assert [item["id"] for item in store.list_all()] == ["evt-1", "evt-2"]
+
+
+def test_orjson_model_matches_google_payload() -> None:
+    model = _orjson_model()
+    payload = GoogleCalendarClient._to_google_payload(_sample_event())
+
+    headers, _, _, body = model.request({}, {}, {}, payload)
+
+    assert headers["content-type"] == "application/json"
+    assert model.deserialize(body.encode()) == payload
+    assert model.deserialize(b"not json") == "not json"
+
+
+def test_google_payloads_do_not_share_reminders() -> None:
+    event = _sample_event().model_copy(
+        update={"reminders": [Reminder(method="popup", minutes_before=15)]}
+    )
+    first = GoogleCalendarClient._to_google_payload(event)
+    first["reminders"]["overrides"].append({"method": "email", "minutes": 60})
 
+    second = GoogleCalendarClient._to_google_payload(event)
+
+    assert second["reminders"] == {
+        "useDefault": False,
+        "overrides": [{"method": "popup", "minutes": 15}],
+    }
+
+
+def test_store_bulk_save_calendar_events(tmp_path) -> None:
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        event = _sample_event()
+        shift = timedelta(hours=2)
+        later = event.model_copy(update={"start": event.start + shift, "end": event.end + shift})
+
+        store.save_calendar_events([("evt-2", later), ("evt-1", event)])
+        store.save_calendar_events([("evt-1", event)])  # upserts in place
+
+        assert [item["id"] for item in store.list_all()] == ["evt-1", "evt-2"]
+
+
+def test_store_list_between_lite_projects_columns(tmp_path) -> None:
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        event = _sample_event()
+        store.save_calendar_event("evt-1", event)
+
+        rows = store.list_between_lite(
+            (event.start - timedelta(minutes=30)).isoformat(),
+            (event.end + timedelta(minutes=30)).isoformat(),
+            cols=("event_id", "title"),
+        )
+
+        assert rows == [{"event_id": "evt-1", "title": "Daily standup"}]
+
+
+def test_store_returned_payloads_do_not_alias_stored_data(tmp_path) -> None:
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        event = _sample_event()
+        store.save_calendar_event("evt-1", event)
+        window = (event.start.isoformat(), event.end.isoformat())
+
+        store.list_between(*window)[0]["title"] = "Edited by caller"
+
+        assert store.list_between(*window)[0]["title"] == "Daily standup"
+
+
+def test_store_migrates_real_timestamps_to_microseconds(tmp_path) -> None:
+    path = tmp_path / "calendar.db"
+    legacy = sqlite3.connect(path)
+    legacy.execute(
+        "CREATE TABLE events (event_id TEXT PRIMARY KEY, title TEXT NOT NULL, "
+        "start_iso TEXT NOT NULL, end_iso TEXT NOT NULL, start_ts REAL NOT NULL, "
+        "end_ts REAL NOT NULL, payload_json TEXT NOT NULL, updated_at TEXT)"
+    )
     event = _sample_event()
-    event_id = client.create_event(event)
+    legacy.execute(
+        "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, NULL)",
+        (
+            "evt-1",
+            event.title,
+            event.start.isoformat(),
+            event.end.isoformat(),
+            event.start.timestamp(),
+            event.end.timestamp(),
+            "{\"id\": \"evt-1\"}",
+        ),
+    )
+    legacy.commit()
+    legacy.close()
+
+    with CalendarSQLiteStore(str(path)) as store:
+
+        rows = store.list_between_lite(
+            event.start.isoformat(), event.end.isoformat(), cols=("event_id", "start_ts")
+        )
+        assert rows == [{"event_id": "evt-1", "start_ts": int(event.start.timestamp()) * 1_000_000}]
 
-    assert event_id.startswith("dry-run-") or event_id == "dry-run-id"
+    # Reopening a migrated store must not scale the values a second time.
+    with CalendarSQLiteStore(str(path)) as store:
+        assert store.list_between_lite(
+            event.start.isoformat(), event.end.isoformat(), cols=("event_id", "start_ts")
+        ) == rows
 
-    listings = client.list_between(
-        (event.start - timedelta(minutes=30)).isoformat(),
-        (event.end + timedelta(minutes=30)).isoformat(),
+
+def test_store_migration_stamps_version_with_rebuilt_table(tmp_path) -> None:
+    path = tmp_path / "calendar.db"
+    legacy = sqlite3.connect(path)
+    legacy.execute(
+        "CREATE TABLE events (event_id TEXT PRIMARY KEY, title TEXT NOT NULL, "
+        "start_iso TEXT NOT NULL, end_iso TEXT NOT NULL, start_ts REAL NOT NULL, "
+        "end_ts REAL NOT NULL, payload_json TEXT NOT NULL, updated_at TEXT)"
     )
-    assert listings
-    assert any(item.get("title") == "Daily standup" for item in listings)
+    legacy.commit()
+    legacy.close()
 
+    store = CalendarSQLiteStore.__new__(CalendarSQLiteStore)
+    store._conn = sqlite3.connect(path)
+    store._migrate_v1()  # as if the process died before the schema script ran
+    store._conn.close()
 
-def test_store_token_roundtrip(tmp_path) -> None:
-    store = CalendarSQLiteStore(str(tmp_path / "calendar.db"))
-    store.save_token("google", "{\"token\": \"value\"}")
-    assert store.load_token("google") == "{\"token\": \"value\"}"
+    check = sqlite3.connect(path)
+    assert check.execute("PRAGMA user_version").fetchone()[0] == 1
+    check.close()
+
+
+# --------------------------------------------------------------- credentials
+
+
+def _token_json(token: str) -> str:
+    return orjson.dumps(
+        {
+            "token": token,
+            "refresh_token": "refresh",
+            "client_id": "client-id",
+            "client_secret": "client-secret",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "expiry": "2099-01-01T00:00:00Z",
+        }
+    ).decode()
+
+
+def _settings(**overrides: str) -> Settings:
+    return Settings(_env_file=None, **overrides)
+
+
+@pytest.fixture
+def creds_cache():
+    _CREDS_CACHE.clear()
+    yield _CREDS_CACHE
+    _CREDS_CACHE.clear()
+
+
+def test_credentials_reused_while_valid(tmp_path, creds_cache, monkeypatch) -> None:
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        store.save_token(TOKEN_PROVIDER, _token_json("first"))
+        manager = GoogleOAuthManager(store, settings=_settings())
+
+        creds = manager.ensure_credentials()
+        monkeypatch.setattr(store, "load_token", lambda provider: pytest.fail("store read"))
+
+        assert creds is not None and creds.token == "first"
+        assert manager.ensure_credentials() is creds
+
+
+def test_credentials_reloaded_inside_expiry_margin(tmp_path, creds_cache) -> None:
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        store.save_token(TOKEN_PROVIDER, _token_json("first"))
+        manager = GoogleOAuthManager(store, settings=_settings())
+        stale = manager.ensure_credentials()
+
+        key = (str(store.path), TOKEN_PROVIDER)
+        creds_cache[key] = (time.time() + 30, stale)  # expires within the margin
+        store.save_token(TOKEN_PROVIDER, _token_json("second"))
+
+        fresh = manager.ensure_credentials()
+
+        assert fresh is not stale and fresh.token == "second"
+        assert creds_cache[key][1] is fresh
+
+
+def test_authorize_replaces_cached_credentials(tmp_path, creds_cache, monkeypatch) -> None:
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    authorised = Credentials.from_authorized_user_info(orjson.loads(_token_json("authorised")))
+
+    class StubFlow:
+        def run_local_server(self, port: int) -> Credentials:
+            return authorised
+
+    monkeypatch.setattr(
+        InstalledAppFlow, "from_client_config", classmethod(lambda cls, *a, **kw: StubFlow())
+    )
+    settings = _settings(google_client_id="client-id", google_client_secret="client-secret")
+    with CalendarSQLiteStore(str(tmp_path / "calendar.db")) as store:
+        store.save_token(TOKEN_PROVIDER, _token_json("first"))
+        manager = GoogleOAuthManager(store, settings=settings)
+        assert manager.ensure_credentials().token == "first"
+
+        assert manager._run_interactive_flow() is authorised
+
+        assert manager.ensure_credentials() is authorised
+        assert orjson.loads(store.load_token(TOKEN_PROVIDER))["token"] == "authorised"
+
+
+def test_credentials_cache_isolated_per_store(tmp_path, creds_cache) -> None:
+    with (
+        CalendarSQLiteStore(str(tmp_path / "a.db")) as store_a,
+        CalendarSQLiteStore(str(tmp_path / "b.db")) as store_b,
+    ):
+        store_a.save_token(TOKEN_PROVIDER, _token_json("token-a"))
+        store_b.save_token(TOKEN_PROVIDER, _token_json("token-b"))
+
+        creds_a = GoogleOAuthManager(store_a, settings=_settings()).ensure_credentials()
+        creds_b = GoogleOAuthManager(store_b, settings=_settings()).ensure_credentials()
+
+        assert (creds_a.token, creds_b.token) == ("token-a", "token-b")
+        assert len(creds_cache) == 2
+
+
+def test_read_possible_json_accepts_inline_json() -> None:
+    assert _read_possible_json('  {"token": "inline"}\n') == '{"token": "inline"}'
+
+
+def test_read_possible_json_reads_file_path(tmp_path) -> None:
+    path = tmp_path / "token.json"
+    path.write_text('{"token": "from-file"}', encoding="utf-8")
+
+    assert _read_possible_json(str(path)) == '{"token": "from-file"}'
+
+
+def test_read_possible_json_ignores_other_strings(tmp_path) -> None:
+    assert _read_possible_json("") is None
+    assert _read_possible_json(str(tmp_path / "missing.json")) is None
+    assert _read_possible_json("not json") is None
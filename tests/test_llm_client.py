@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from models import SuggestionPayload
+from services.llm_client import OpenAIProvider
+
+
+class StubResponses:
+    def __init__(self) -> None:
+        self.kwargs: dict = {}
+
+    @contextmanager
+    def stream(self, **kwargs):
+        self.kwargs = kwargs
+        response = SimpleNamespace(output=[object()], output_text='{"candidates": []}')
+        yield SimpleNamespace(get_final_response=lambda: response)
+
+
+def test_request_body_carries_strict_suggestion_schema() -> None:
+    responses = StubResponses()
+    provider = OpenAIProvider(
+        api_host="",
+        api_key="test",
+        model="gpt-test",
+        temperature=0.0,
+        client=SimpleNamespace(responses=responses),
+    )
+
+    payload = provider.suggest_events("plan my day", "2025-05-20T09:00:00+03:00", "Europe/Riga")
+
+    assert payload == SuggestionPayload(candidates=[])
+    text_format = responses.kwargs["text"]["format"]
+    assert text_format["type"] == "json_schema"
+    assert text_format["name"] == "SuggestionPayload"
+    assert text_format["strict"] is True
+    schema = text_format["schema"]
+    assert schema["required"] == ["candidates"]
+    assert schema["additionalProperties"] is False
+    draft = schema["$defs"]["EventDraft"]
+    assert draft["required"] == list(draft["properties"])
+    assert draft["additionalProperties"] is False
+    assert "default" not in draft["properties"]["description"]
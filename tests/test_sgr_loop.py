@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from models import (
@@ -13,6 +14,7 @@ from models import (
     SuggestionPayload,
 )
 from sgr import SGRController
+from utils.repair import _has_conflict, _merge_busy
 
 
 class StubLLM:
@@ -92,3 +94,146 @@ def test_commit_counts_operations() -> None:
     assert result.updated == 0
     assert result.errors == []
     assert calendar.created  # ensure call went through
+
+
+class BulkStubCalendar(StubCalendar):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[CalendarEvent]] = []
+        self.update_batches: list[list[tuple[str, CalendarEvent]]] = []
+
+    def bulk_create(self, events: list[CalendarEvent]) -> list[str]:
+        self.batches.append(list(events))
+        return [f"created-{i}" for i in range(len(events))]
+
+    def bulk_update(self, items: list[tuple[str, CalendarEvent]]) -> list[str]:
+        self.update_batches.append(list(items))
+        return [ev_id for ev_id, _ in items]
+
+
+def test_commit_batches_multiple_creates() -> None:
+    calendar = BulkStubCalendar()
+    controller = SGRController(llm=StubLLM(), calendar=calendar)
+    response = controller.suggest(SuggestEventsRequest(instruction="schedule", timezone="Europe/Riga"))
+    event = response.candidates[0]
+    plan = CommitPlan(
+        items=[
+            CommitPlanItem(event=event, decision=CommitDecision(kind="create")),
+            CommitPlanItem(event=event, decision=CommitDecision(kind="skip")),
+            CommitPlanItem(event=event, decision=CommitDecision(kind="create")),
+        ],
+        trace_id=response.trace_id,
+    )
+
+    result = controller.commit(plan)
+
+    assert result.created == 2
+    assert result.skipped == 1
+    assert len(calendar.batches) == 1 and len(calendar.batches[0]) == 2
+    assert calendar.created == []  # no per-event round-trips
+
+
+def test_commit_batches_multiple_updates() -> None:
+    calendar = BulkStubCalendar()
+    controller = SGRController(llm=StubLLM(), calendar=calendar)
+    response = controller.suggest(SuggestEventsRequest(instruction="schedule", timezone="Europe/Riga"))
+    event = response.candidates[0]
+    plan = CommitPlan(
+        items=[
+            CommitPlanItem(event=event, decision=CommitDecision(kind="update")),
+            CommitPlanItem(event=event, decision=CommitDecision(kind="create")),
+            CommitPlanItem(event=event, decision=CommitDecision(kind="update")),
+        ],
+        trace_id=response.trace_id,
+    )
+
+    result = controller.commit(plan)
+
+    assert result.updated == 2
+    assert result.created == 1
+    assert [ev_id for ev_id, _ in calendar.update_batches[0]] == [event.title, event.title]
+    assert calendar.updated == []  # no per-event round-trips
+    assert len(calendar.created) == 1  # a single create skips the batch path
+
+
+def test_asuggest_matches_sync_suggest() -> None:
+    controller = SGRController(llm=StubLLM(), calendar=StubCalendar())
+    request = SuggestEventsRequest(instruction="schedule focus", timezone="Europe/Riga")
+
+    response = asyncio.run(controller.asuggest(request))
+
+    assert [ev.start for ev in response.candidates] == [
+        ev.start for ev in controller.suggest(request).candidates
+    ]
+
+
+class CountingStubCalendar(StubCalendar):
+    def __init__(self) -> None:
+        super().__init__()
+        self.windows: list[tuple[str, str]] = []
+
+    def list_between(self, time_min_iso: str, time_max_iso: str) -> list[dict]:
+        self.windows.append((time_min_iso, time_max_iso))
+        return self.busy_payload
+
+
+def test_suggest_fetches_busy_slots_once_per_request() -> None:
+    llm = StubLLM()
+    base_tz = ZoneInfo("Europe/Riga")
+    llm.payload.candidates.append(
+        EventDraft(
+            title="Review",
+            start=datetime(2025, 5, 20, 14, 0, tzinfo=base_tz),
+            end=datetime(2025, 5, 20, 15, 0, tzinfo=base_tz),
+            timezone="Europe/Riga",
+        )
+    )
+    calendar = CountingStubCalendar()
+    controller = SGRController(llm=llm, calendar=calendar)
+
+    response = controller.suggest(SuggestEventsRequest(instruction="schedule", timezone="Europe/Riga"))
+
+    assert len(calendar.windows) == 1
+    assert [ev.start.hour for ev in response.candidates] == [10, 14]
+
+
+def test_commit_plan_from_suggestions() -> None:
+    calendar = StubCalendar()
+    controller = SGRController(llm=StubLLM(), calendar=calendar)
+    response = controller.suggest(SuggestEventsRequest(instruction="schedule", timezone="Europe/Riga"))
+
+    plan = CommitPlan.from_suggestions(response)
+
+    assert plan.trace_id == response.trace_id
+    assert plan.model_dump() == CommitPlan(
+        items=[
+            CommitPlanItem(event=ev, decision=CommitDecision(kind="create"))
+            for ev in response.candidates
+        ],
+        trace_id=response.trace_id,
+    ).model_dump()
+    assert controller.commit(plan).created == len(response.candidates)
+
+
+def test_conflict_check_matches_linear_scan() -> None:
+    base = datetime(2025, 5, 20, tzinfo=ZoneInfo("UTC"))
+
+    def at(minutes: int) -> datetime:
+        return base + timedelta(minutes=minutes)
+
+    busy = [
+        (at(0), at(600)),  # long slot that started earlier than the others
+        (at(60), at(90)),  # nested inside it, so ends are not monotonic
+        (at(700), at(760)),
+        (at(740), at(800)),  # overlaps the previous slot
+        (at(800), at(830)),  # touches the previous slot
+        (at(900), at(900)),  # zero length
+        (at(1000), at(1030)),
+    ]
+    starts, ends = _merge_busy(busy[::-1])
+
+    for start_min in range(-60, 1100, 5):
+        for length in (0, 15, 60):
+            start, end = at(start_min), at(start_min + length)
+            expected = any(b_start < end and b_end > start for b_start, b_end in busy)
+            assert _has_conflict(start, end, starts, ends) == expected, (start_min, length)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import importlib
+import logging
+
+import pytest
+import utils.time as time_utils
+
+
+@pytest.fixture
+def reload_time_utils(monkeypatch):
+    yield time_utils
+    monkeypatch.delenv("SGR_TZ_CACHE", raising=False)
+    importlib.reload(time_utils)
+
+
+def test_unknown_timezone_falls_back_to_default_with_warning(caplog) -> None:
+    with caplog.at_level(logging.WARNING, logger=time_utils.__name__):
+        zone = time_utils._resolve_zone("Mars/Olympus_Mons")
+
+    assert zone.key == time_utils.DEFAULT_TZ
+    assert "Mars/Olympus_Mons" in caplog.text
+
+
+def test_get_zoneinfo_reuses_cached_zone() -> None:
+    time_utils.get_zoneinfo.cache_clear()
+
+    first = time_utils.get_zoneinfo("America/New_York")
+    second = time_utils.get_zoneinfo("America/New_York")
+
+    assert second is first
+    assert time_utils.get_zoneinfo.cache_info().hits == 1
+
+
+def test_tz_cache_can_be_disabled(monkeypatch, reload_time_utils) -> None:
+    monkeypatch.setenv("SGR_TZ_CACHE", "0")
+    module = importlib.reload(reload_time_utils)
+
+    assert module.get_zoneinfo is module._resolve_zone
+    assert not hasattr(module.get_zoneinfo, "cache_info")
+    assert module.get_zoneinfo("Europe/Berlin").key == "Europe/Berlin"